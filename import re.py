@@ -1,13 +1,13 @@
 import re
+import sys
+from bisect import bisect_right
 from collections import defaultdict
 from tqdm import tqdm
-import spacy
-from spacy.matcher import Matcher
 
 
 CONTEXT = 2
 HL_S, HL_E = "[[", "]]"
-nlp = spacy.load("en_core_web_sm")
+nlp = matcher = phrase_matcher = _MID2TAG = None
 
 
 VOCAB = {
@@ -33,23 +33,53 @@ VOCAB = {
 
 ALL_KEYWORDS = set().union(*VOCAB.values())
 
+_HL_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(ALL_KEYWORDS, key=len, reverse=True))) + r")\b",
+    re.I,
+)
 
-matcher = Matcher(nlp.vocab)
-matcher.add("MEASUREMENT", [[{"LIKE_NUM": True},{"LOWER": {"IN": ["nm","um","mm","cm"]}}]])
-matcher.add("NUMERIC_RANGE", [
-    [{"LIKE_NUM": True},{"TEXT": {"IN": ["-","–"]}},{"LIKE_NUM": True}],
-    [{"LOWER":"between"},{"LIKE_NUM":True},{"LOWER":"and"},{"LIKE_NUM":True}]
-])
-matcher.add("SOLVENT_RATIO", [[{"LIKE_NUM":True},{"TEXT":{"IN":[":","/"]}},{"LIKE_NUM":True}]])
 
+def load_pipeline():
+    # spaCy and the model are only loaded once there is text to analyze
+    global nlp, matcher, phrase_matcher, _MID2TAG
+    if nlp is not None:
+        return
+    import spacy
+    from spacy.matcher import Matcher, PhraseMatcher
 
-def looks_like_table(t): 
-    return bool(re.search(r"\d", t)) and ("  " in t or "\t" in t)
+    nlp = spacy.load("en_core_web_sm", exclude=["tok2vec","tagger","attribute_ruler","lemmatizer","ner","parser"])
+    nlp.enable_pipe("senter")
+
+    matcher = Matcher(nlp.vocab)
+    matcher.add("MEASUREMENT", [[{"LIKE_NUM": True},{"LOWER": {"IN": ["nm","um","mm","cm"]}}]])
+    matcher.add("NUMERIC_RANGE", [
+        [{"LIKE_NUM": True},{"TEXT": {"IN": ["-","–"]}},{"LIKE_NUM": True}],
+        [{"LOWER":"between"},{"LIKE_NUM":True},{"LOWER":"and"},{"LIKE_NUM":True}]
+    ])
+    matcher.add("SOLVENT_RATIO", [[{"LIKE_NUM":True},{"TEXT":{"IN":[":","/"]}},{"LIKE_NUM":True}]])
+
+    phrase_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    for name, words in VOCAB.items():
+        phrase_matcher.add(name, [nlp.make_doc(w) for w in words])
+
+    _MID2TAG = {nlp.vocab.strings[k]: k for k in (*VOCAB, "MEASUREMENT", "NUMERIC_RANGE", "SOLVENT_RATIO")}
+
+
+_DIGIT_RE = re.compile(r"\d")
+
+def looks_like_table(t):
+    return ("  " in t or "\t" in t) and _DIGIT_RE.search(t) is not None
+
+def by_sentence(matches, sents, starts):
+    out = defaultdict(list)
+    for mid, start, end in matches:
+        j = bisect_right(starts, start) - 1
+        if end <= sents[j].end:
+            out[j].append(_MID2TAG[mid])
+    return out
 
 def highlight(t):
-    for k in sorted(ALL_KEYWORDS, key=len, reverse=True):
-        t = re.sub(rf"\b{re.escape(k)}\b", f"{HL_S}\\g<0>{HL_E}", t, flags=re.I)
-    return t
+    return _HL_RE.sub(lambda m: f"{HL_S}{m.group(0)}{HL_E}", t)
 
 def classify(tags):
     return (
@@ -62,24 +92,32 @@ def classify(tags):
 
 
 def analyze(text):
-    sents = list(nlp(text).sents)
+    load_pipeline()
+    doc = nlp(text)
+    sents = list(doc.sents)
     if not sents:
         print("\n⚠️ No sentences detected.\n")
         return {}
 
+    # run both matchers once over the whole doc, bucket hits by sentence
+    starts = [s.start for s in sents]
+    sent_vocab = by_sentence(phrase_matcher(doc), sents, starts)
+    # every Matcher rule needs a LIKE_NUM token
+    has_num = any(tok.like_num for tok in doc)
+    sent_matches = by_sentence(matcher(doc) if has_num else [], sents, starts)
+
     hits, out = [], defaultdict(list)
     print(f"\nAnalyzing {len(sents)} sentences...\n")
 
     for i, s in enumerate(tqdm(sents, desc="Processing")):
-        t, tl, score, tags = s.text.strip(), s.text.lower(), 0, set()
+        t, score, tags = s.text.strip(), 0, set()
 
-        for name, words in VOCAB.items():
-            if any(w in tl for w in words):
-                score += 3 if name != "SOLVENT" else 2
-                tags.add(name)
+        for name in set(sent_vocab[i]):
+            score += 3 if name != "SOLVENT" else 2
+            tags.add(name)
 
-        for mid,_,_ in matcher(s):
-            tags.add(nlp.vocab.strings[mid])
+        for tag in sent_matches[i]:
+            tags.add(tag)
             score += 4
 
         if looks_like_table(t):
@@ -89,15 +127,14 @@ def analyze(text):
         if score:
             hits.append((max(0,i-CONTEXT), min(len(sents),i+CONTEXT+1), score, tags))
 
-    # merge
+    # merge (hits are already ordered by start)
     merged = []
-    for h in sorted(hits):
-        if not merged or h[0] > merged[-1][1]:
-            merged.append(list(h))
+    for a,b,score,tags in hits:
+        if not merged or a > merged[-1][1]:
+            merged.append((a, b, score, tags))
         else:
-            merged[-1][1] = max(merged[-1][1], h[1])
-            merged[-1][2] = max(merged[-1][2], h[2])
-            merged[-1][3] |= h[3]
+            pa, pb, pscore, ptags = merged[-1]
+            merged[-1] = (pa, max(pb, b), max(pscore, score), ptags | tags)
 
     for a,b,score,tags in merged:
         ctx = [highlight(sents[i].text.strip()) for i in range(a,b)]
@@ -106,13 +143,9 @@ def analyze(text):
     return out
 
 
-print("Paste text (Enter twice to finish):\n")
-lines = []
-while (l := input()):
-    lines.append(l)
-
-text = "\n".join(lines)
-if not text.strip():
+print("Paste text (Ctrl-D to finish, Ctrl-Z then Enter on Windows):\n")
+text = sys.stdin.read().strip()
+if not text:
     print("\n⚠️ No text provided.\n")
     exit()
 
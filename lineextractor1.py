@@ -1,13 +1,8 @@
-print("Paste your text below. Press Enter twice to finish:")
+import sys
 
-lines = []
-while True:
-    line = input()
-    if line == "":
-        break
-    lines.append(line)
+print("Paste your text below. Press Ctrl-D to finish (Ctrl-Z then Enter on Windows):")
 
-text = "\n".join(lines)
+text = sys.stdin.read()
 
 stationary_keywords = [
     "pore size",
@@ -3,12 +3,32 @@ Enhanced Polymer Chromatography Condition Extractor
 Builds on your existing code to extract detailed mobile phase and column conditions
 """
 
-import pdfplumber
-import matplotlib.pyplot as plt
+import io
 import re
-from collections import defaultdict
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from functools import partial
+from typing import List, Optional
 import json
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 polymer_names = [
     'Jordi', 'Nucleosil', 'Discovery', 'Zorbax', 'Tosoh', 
@@ -26,23 +46,170 @@ common_solvents = [
     'dimethoxyethane'
 ]
 
-def extract_text_from_pdf(pdf_path):
-    """Extract text from a PDF file."""
+
+column_types = [
+    'DVB', 'divinylbenzene', 'C18', 'C8', 'C6', 'PEG', 'polyethylene glycol',
+    'Diol', 'silica', 'RP', 'reversed phase', 'normal phase', 'NP',
+    'amino', 'CN', 'cyano', 'phenyl'
+]
+
+
+polymer_samples = [
+    'PEG', 'PPG', 'Pluronic', 'Synperonic', 'poloxamer', 'Imbentin',
+    'EO-PO-EO', 'PO-EO-PO', 'polyethylene glycol', 'polypropylene glycol',
+    'triblock', 'diblock', 'block copolymer'
+]
+
+
+class TermFinder:
+    """
+    Case-insensitive substring search for a fixed list of terms.
+    Uses a single Aho-Corasick pass when pyahocorasick is installed.
+    """
+
+    def __init__(self, terms):
+        self.terms = list(terms)
+        self.terms_lower = [t.lower() for t in self.terms]
+        self.automaton = None
+        if ahocorasick is not None and self.terms:
+            # terms that are equal once lowercased share one key
+            indices = defaultdict(list)
+            for idx, term in enumerate(self.terms_lower):
+                indices[term].append(idx)
+            self.automaton = ahocorasick.Automaton()
+            for term, idxs in indices.items():
+                self.automaton.add_word(term, idxs)
+            self.automaton.make_automaton()
+
+    def findall(self, text_lower):
+        """Return the terms contained in text_lower, in list order."""
+        if self.automaton is None:
+            return [t for t, tl in zip(self.terms, self.terms_lower) if tl in text_lower]
+        found = {idx for _, idxs in self.automaton.iter(text_lower) for idx in idxs}
+        return [self.terms[idx] for idx in sorted(found)]
+
+    def first(self, text_lower):
+        """Return the first term (in list order) contained in text_lower."""
+        found = self.findall(text_lower)
+        return found[0] if found else None
+
+
+condition_keywords = [
+    'column', 'mobile phase', 'eluent', 'flow rate', 'temperature',
+    'particle diameter', 'pore size', 'acetone', 'methanol', 'water', 'gradient'
+]
+
+
+analysis_keywords = [
+    'analyzed', 'separated', 'eluted', 'chromatogram',
+    'measured', 'obtained on', 'using', 'performed on'
+]
+
+
+_CONDITION_TRIGGER_RE = re.compile('|'.join(map(re.escape, condition_keywords)), re.IGNORECASE)
+_ANALYSIS_TRIGGER_RE = re.compile('|'.join(map(re.escape, analysis_keywords)), re.IGNORECASE)
+_MEASUREMENT_RE = re.compile(
+    r'(?P<dim>(?P<dim_1>\d+\.?\d*)\s*[×x!]\s*(?P<dim_2>\d+\.?\d*)\s*mm)'
+    r'|(?P<particle>(?P<particle_size>\d+\.?\d*)\s*(?:μm|µm|um))'
+    r'|(?P<pore>(?P<pore_size>\d+\.?\d*)\s*[AÅ])',
+    re.IGNORECASE
+)
+_GRADIENT_RES = (
+    re.compile(r'gradient[:\s]+(\d+)-(\d+)%\s+over\s+(\d+)\s*min', re.IGNORECASE),
+    re.compile(r'gradient[:\s]+from\s+(\d+)%?\s+to\s+(\d+)%', re.IGNORECASE),
+    re.compile(r'(\d+)-(\d+)%\s+gradient', re.IGNORECASE)
+)
+_MP_RE = re.compile(r'(\w+)\s+(\w+)\s+(\d+):(\d+)\s*\(([wv]/[wv])\)', re.IGNORECASE)
+_RATIO_RE = re.compile(r'(\d+):(\d+)\s*\(([wv]/[wv])\)')
+_ADDITIVE_RES = (
+    re.compile(r'(\d+\.?\d*)\s*%\s+([A-Za-z]+)', re.IGNORECASE),
+    re.compile(r'(\d+\.?\d*)\s*(mM|M)\s+([A-Za-z\s]+)', re.IGNORECASE),
+    re.compile(r'with\s+(\d+\.?\d*%?\s*[A-Za-z\s]+)', re.IGNORECASE),
+    re.compile(r'containing\s+(\d+\.?\d*%?\s*[A-Za-z\s]+)', re.IGNORECASE)
+)
+_FLOW_RE = re.compile(r'(?:flow[\s-]?rate[:\s]*)?(\d+\.?\d*)\s*(mL|ml|μL|µL)/min', re.IGNORECASE)
+_TEMP_RE = re.compile(r'(?:temperature[:\s]*)?(\d+\.?\d*)\s*[°8]\s*C', re.IGNORECASE)
+
+
+brand_finder = TermFinder(polymer_names)
+type_finder = TermFinder(column_types)
+solvent_finder = TermFinder(common_solvents)
+sample_finder = TermFinder(polymer_samples)
+
+
+@dataclass(slots=True)
+class Condition:
+    """Chromatography conditions extracted around one source line."""
+    line: str = ''
+    column_brand: Optional[str] = None
+    column_type: Optional[str] = None
+    dimensions: Optional[str] = None
+    particle_size: Optional[str] = None
+    pore_size: Optional[str] = None
+    mobile_phase_solvents: List[str] = field(default_factory=list)
+    solvent_ratio: Optional[str] = None
+    solvent_additives: List[str] = field(default_factory=list)
+    gradient_info: Optional[str] = None
+    is_gradient: bool = False
+    flow_rate: Optional[str] = None
+    temperature: Optional[str] = None
+
+
+def extract_text_from_pdf(pdf_path, parser=None):
+    """
+    Extract text from a PDF file.
+    parser is 'pypdfium2' or 'pdfplumber'; by default pypdfium2 is used
+    when it is installed, since only the raw text is needed.
+    Note the two backends do not produce identical text: pypdfium2 keeps
+    word spacing that pdfplumber often drops, so extraction results can
+    differ between them.
+    """
+    if parser is None:
+        parser = 'pypdfium2' if pdfium is not None else 'pdfplumber'
+    
+    if parser == 'pypdfium2':
+        return _extract_text_pdfium(pdf_path)
+    if parser == 'pdfplumber':
+        return _extract_text_pdfplumber(pdf_path)
+    raise ValueError(f"Unknown PDF parser: {parser!r}")
+
+def _extract_text_pdfium(pdf_path):
+    """Extract text page by page with pypdfium2."""
+    parts = []
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            text = textpage.get_text_range()
+            # PDFium marks line-end hyphenation with U+FFFE; rejoin the word
+            text = text.replace('\ufffe\r\n', '').replace('\ufffe', '')
+            parts.append(text.replace('\r\n', '\n'))
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return '\n'.join(parts)
+
+def _extract_text_pdfplumber(pdf_path):
+    """Extract text page by page with pdfplumber."""
+    import pdfplumber
+    
+    parts = []
     with pdfplumber.open(pdf_path) as pdf:
-        text = ''
         for page in pdf.pages:
-            text += page.extract_text() + '\n'
-    return text
+            parts.append(page.extract_text() or '')
+            page.flush_cache()
+    return '\n'.join(parts)
 
 def identify_polymers(text, polymer_names):
     """Identify mentions of polymers in the extracted text."""
     polymer_dict = {name: [] for name in polymer_names}
+    finder = TermFinder(polymer_names)
     
     lines = text.split('\n')
     for line in lines:
-        for polymer in polymer_names:
-            if polymer.lower() in line.lower():
-                polymer_dict[polymer].append(line)
+        for polymer in finder.findall(line.lower()):
+            polymer_dict[polymer].append(line)
     
     return polymer_dict
 
@@ -51,121 +218,76 @@ def extract_chromatography_conditions(text):
     Extract detailed chromatography conditions.
     Enhanced to include additives, gradients, and column info.
     """
-    conditions = []
+    unique_by_sig = {}
     lines = text.split('\n')
     
     for i, line in enumerate(lines):
-        line_lower = line.lower()
-        
-       
-        keywords = ['column', 'mobile phase', 'eluent', 'flow rate', 
-                   'temperature', 'particle diameter', 'pore size', 
-                   'acetone', 'methanol', 'water', 'gradient']
-        
-        if any(keyword in line_lower for keyword in keywords):
+        if _CONDITION_TRIGGER_RE.search(line):
             
             context_start = max(0, i-3)
             context_end = min(len(lines), i+4)
             context = ' '.join(lines[context_start:context_end])
+            context_lower = context.lower()
             
-            cond = {
-                'line': line.strip(),
-                'column_brand': None,
-                'column_type': None,
-                'dimensions': None,
-                'particle_size': None,
-                'pore_size': None,
-                'mobile_phase_solvents': [],
-                'solvent_ratio': None,
-                'solvent_additives': [],
-                'gradient_info': None,
-                'is_gradient': False,
-                'flow_rate': None,
-                'temperature': None
-            }
-            
-            for brand in polymer_names:
-                if brand.lower() in context.lower():
-                    cond['column_brand'] = brand
-                    break
-            
-            
-            types = ['DVB', 'divinylbenzene', 'C18', 'C8', 'C6', 'PEG', 'polyethylene glycol',
-                    'Diol', 'silica', 'RP', 'reversed phase', 'normal phase', 'NP',
-                    'amino', 'CN', 'cyano', 'phenyl']
-            for t in types:
-                if t.lower() in context.lower():
-                    cond['column_type'] = t
-                    break
-            
+            cond = Condition(line=line.strip())
             
-            dim_match = re.search(r'(\d+\.?\d*)\s*[×x!]\s*(\d+\.?\d*)\s*mm', context, re.IGNORECASE)
-            if dim_match:
-                cond['dimensions'] = f"{dim_match.group(1)}×{dim_match.group(2)} mm"
+            cond.column_brand = brand_finder.first(context_lower)
             
             
-            particle_match = re.search(r'(?:particle\s+(?:diameter|size)[:\s]*)?(\d+\.?\d*)\s*(μm|µm|um)', context, re.IGNORECASE)
-            if particle_match:
-                cond['particle_size'] = f"{particle_match.group(1)} μm"
+            cond.column_type = type_finder.first(context_lower)
             
             
-            pore_match = re.search(r'(?:pore\s+size[:\s]*)?(\d+\.?\d*)\s*[AÅ]', context, re.IGNORECASE)
-            if pore_match:
-                cond['pore_size'] = f"{pore_match.group(1)} Å"
+            # first dimension, particle size and pore size in one scan
+            for m in _MEASUREMENT_RE.finditer(context):
+                kind = m.lastgroup
+                if kind == 'dim' and not cond.dimensions:
+                    cond.dimensions = f"{m.group('dim_1')}×{m.group('dim_2')} mm"
+                elif kind == 'particle' and not cond.particle_size:
+                    cond.particle_size = f"{m.group('particle_size')} μm"
+                elif kind == 'pore' and not cond.pore_size:
+                    cond.pore_size = f"{m.group('pore_size')} Å"
+                if cond.dimensions and cond.particle_size and cond.pore_size:
+                    break
             
             
-            if 'gradient' in context.lower():
-                cond['is_gradient'] = True
+            if 'gradient' in context_lower:
+                cond.is_gradient = True
                
-                gradient_patterns = [
-                    r'gradient[:\s]+(\d+)-(\d+)%\s+over\s+(\d+)\s*min',
-                    r'gradient[:\s]+from\s+(\d+)%?\s+to\s+(\d+)%',
-                    r'(\d+)-(\d+)%\s+gradient'
-                ]
-                for pattern in gradient_patterns:
-                    grad_match = re.search(pattern, context, re.IGNORECASE)
+                for pattern in _GRADIENT_RES:
+                    grad_match = pattern.search(context)
                     if grad_match:
                         if len(grad_match.groups()) == 3:
-                            cond['gradient_info'] = f"{grad_match.group(1)}-{grad_match.group(2)}% over {grad_match.group(3)} min"
+                            cond.gradient_info = f"{grad_match.group(1)}-{grad_match.group(2)}% over {grad_match.group(3)} min"
                         else:
-                            cond['gradient_info'] = f"{grad_match.group(1)}-{grad_match.group(2)}%"
+                            cond.gradient_info = f"{grad_match.group(1)}-{grad_match.group(2)}%"
                         break
                 
                 
-                if not cond['gradient_info']:
-                    cond['gradient_info'] = "gradient elution (details in text)"
+                if not cond.gradient_info:
+                    cond.gradient_info = "gradient elution (details in text)"
             
             
-            mp_pattern = r'(\w+)\s+(\w+)\s+(\d+):(\d+)\s*\(([wv]/[wv])\)'
-            mp_match = re.search(mp_pattern, context, re.IGNORECASE)
+            mp_match = _MP_RE.search(context)
             
             if mp_match:
                 solv1, solv2 = mp_match.group(1), mp_match.group(2)
                 ratio1, ratio2 = mp_match.group(3), mp_match.group(4)
                 ratio_type = mp_match.group(5)
                 
-                cond['mobile_phase_solvents'] = [solv1, solv2]
-                cond['solvent_ratio'] = f"{ratio1}:{ratio2} ({ratio_type})"
+                cond.mobile_phase_solvents = [solv1, solv2]
+                cond.solvent_ratio = f"{ratio1}:{ratio2} ({ratio_type})"
             else:
                 
-                ratio_match = re.search(r'(\d+):(\d+)\s*\(([wv]/[wv])\)', context)
+                ratio_match = _RATIO_RE.search(context)
                 if ratio_match:
-                    cond['solvent_ratio'] = f"{ratio_match.group(1)}:{ratio_match.group(2)} ({ratio_match.group(3)})"
+                    cond.solvent_ratio = f"{ratio_match.group(1)}:{ratio_match.group(2)} ({ratio_match.group(3)})"
                     # Find solvents nearby
-                    for solv in common_solvents:
-                        if solv.lower() in context.lower() and solv not in cond['mobile_phase_solvents']:
-                            cond['mobile_phase_solvents'].append(solv)
-            
+                    cond.mobile_phase_solvents = solvent_finder.findall(context_lower)
             
-            additive_patterns = [
-                r'(\d+\.?\d*)\s*%\s+([A-Za-z]+)',  
-                r'(\d+\.?\d*)\s*(mM|M)\s+([A-Za-z\s]+)',  
-                r'with\s+(\d+\.?\d*%?\s*[A-Za-z\s]+)',  
-                r'containing\s+(\d+\.?\d*%?\s*[A-Za-z\s]+)'  
-            ]
             
-            for pattern in additive_patterns:
-                add_matches = re.findall(pattern, context, re.IGNORECASE)
+            seen_additives = set()
+            for pattern in _ADDITIVE_RES:
+                add_matches = pattern.findall(context)
                 for match in add_matches:
                     if isinstance(match, tuple):
                         additive = ' '.join(str(x) for x in match).strip()
@@ -173,98 +295,68 @@ def extract_chromatography_conditions(text):
                         additive = match.strip()
                     
                     
-                    if additive and len(additive) > 2 and additive not in cond['solvent_additives']:
-                        cond['solvent_additives'].append(additive)
+                    if additive and len(additive) > 2 and additive not in seen_additives:
+                        seen_additives.add(additive)
+                        cond.solvent_additives.append(additive)
             
             
-            flow_match = re.search(r'(?:flow[\s-]?rate[:\s]*)?(\d+\.?\d*)\s*(mL|ml|μL|µL)/min', context, re.IGNORECASE)
+            flow_match = _FLOW_RE.search(context)
             if flow_match:
-                cond['flow_rate'] = f"{flow_match.group(1)} {flow_match.group(2)}/min"
+                cond.flow_rate = f"{flow_match.group(1)} {flow_match.group(2)}/min"
             
             
-            temp_match = re.search(r'(?:temperature[:\s]*)?(\d+\.?\d*)\s*[°8]\s*C', context, re.IGNORECASE)
+            temp_match = _TEMP_RE.search(context)
             if temp_match:
-                cond['temperature'] = f"{temp_match.group(1)}°C"
+                cond.temperature = f"{temp_match.group(1)}°C"
             
             
-            if any([cond['column_brand'], cond['mobile_phase_solvents'], 
-                   cond['flow_rate'], cond['temperature'], cond['is_gradient']]):
-                conditions.append(cond)
-    
+            if any([cond.column_brand, cond.mobile_phase_solvents, 
+                   cond.flow_rate, cond.temperature, cond.is_gradient]):
+                sig = (cond.column_brand, cond.solvent_ratio, cond.flow_rate, cond.is_gradient)
+                if sig not in unique_by_sig:
+                    unique_by_sig[sig] = cond
     
-    seen = set()
-    unique = []
-    for c in conditions:
-        sig = (c['column_brand'], c['solvent_ratio'], c['flow_rate'], c['is_gradient'])
-        if sig not in seen:
-            seen.add(sig)
-            unique.append(c)
-    
-    return unique
+    return list(unique_by_sig.values())
 
 def extract_polymer_column_associations(text):
     """
     Extract which polymers (samples) are analyzed on which columns.
     This looks for patterns like "Polymer X was analyzed on Column Y"
     """
-    associations = []
+    unique_by_sig = {}
     lines = text.split('\n')
     
-    
-    polymer_samples = [
-        'PEG', 'PPG', 'Pluronic', 'Synperonic', 'poloxamer', 'Imbentin',
-        'EO-PO-EO', 'PO-EO-PO', 'polyethylene glycol', 'polypropylene glycol',
-        'triblock', 'diblock', 'block copolymer'
-    ]
-    
     for i, line in enumerate(lines):
-        line_lower = line.lower()
-        
-       
-        analysis_keywords = ['analyzed', 'separated', 'eluted', 'chromatogram', 
-                            'measured', 'obtained on', 'using', 'performed on']
-        
-        if any(keyword in line_lower for keyword in analysis_keywords):
+        if _ANALYSIS_TRIGGER_RE.search(line):
           
             context_start = max(0, i-2)
             context_end = min(len(lines), i+3)
             context = ' '.join(lines[context_start:context_end])
+            context_lower = context.lower()
             
             
-            found_polymers = []
-            for polymer in polymer_samples:
-                if polymer.lower() in context.lower():
-                    found_polymers.append(polymer)
+            found_polymers = sample_finder.findall(context_lower)
             
            
-            found_columns = []
-            for column in polymer_names:
-                if column.lower() in context.lower():
-                    found_columns.append(column)
+            found_columns = brand_finder.findall(context_lower)
             
             
             if found_polymers and found_columns:
                 for poly in found_polymers:
                     for col in found_columns:
-                        associations.append({
-                            'polymer': poly,
-                            'column': col,
-                            'context': line.strip()
-                        })
-    
-    
-    seen = set()
-    unique = []
-    for assoc in associations:
-        sig = (assoc['polymer'], assoc['column'])
-        if sig not in seen:
-            seen.add(sig)
-            unique.append(assoc)
-    
-    return unique
+                        if (poly, col) not in unique_by_sig:
+                            unique_by_sig[(poly, col)] = {
+                                'polymer': poly,
+                                'column': col,
+                                'context': line.strip()
+                            }
+    
+    return list(unique_by_sig.values())
 
 def plot_polymer_frequency(polymer_dict):
     """Plot a bar graph of the frequency of polymer mentions."""
+    import matplotlib.pyplot as plt
+    
     names = list(polymer_dict.keys())
     counts = [len(lines) for lines in polymer_dict.values()]
 
@@ -288,80 +380,80 @@ def print_detailed_conditions(conditions):
         print("-"*100)
         
         
-        if cond['column_brand']:
-            col_str = f"  Column: {cond['column_brand']}"
-            if cond['column_type']:
-                col_str += f" ({cond['column_type']})"
+        if cond.column_brand:
+            col_str = f"  Column: {cond.column_brand}"
+            if cond.column_type:
+                col_str += f" ({cond.column_type})"
             print(col_str)
             
-            if cond['dimensions']:
-                print(f"      -> Dimensions: {cond['dimensions']}")
-            if cond['particle_size']:
-                print(f"      -> Particle size: {cond['particle_size']}")
-            if cond['pore_size']:
-                print(f"      -> Pore size: {cond['pore_size']}")
+            if cond.dimensions:
+                print(f"      -> Dimensions: {cond.dimensions}")
+            if cond.particle_size:
+                print(f"      -> Particle size: {cond.particle_size}")
+            if cond.pore_size:
+                print(f"      -> Pore size: {cond.pore_size}")
         
         
-        if cond['mobile_phase_solvents'] or cond['is_gradient']:
+        if cond.mobile_phase_solvents or cond.is_gradient:
             print(f"  Mobile phase:")
             
-            if cond['is_gradient']:
+            if cond.is_gradient:
                 print(f"      -> Type: Gradient")
-                if cond['gradient_info']:
-                    print(f"      -> Gradient: {cond['gradient_info']}")
+                if cond.gradient_info:
+                    print(f"      -> Gradient: {cond.gradient_info}")
             else:
                 print(f"      -> Type: Isocratic")
             
-            if cond['mobile_phase_solvents']:
-                print(f"      -> Solvents: {', '.join(cond['mobile_phase_solvents'])}")
+            if cond.mobile_phase_solvents:
+                print(f"      -> Solvents: {', '.join(cond.mobile_phase_solvents)}")
             
-            if cond['solvent_ratio']:
-                print(f"      -> Ratio: {cond['solvent_ratio']}")
+            if cond.solvent_ratio:
+                print(f"      -> Ratio: {cond.solvent_ratio}")
             
-            if cond['solvent_additives']:
-                print(f"      -> Additives: {', '.join(cond['solvent_additives'])}")
+            if cond.solvent_additives:
+                print(f"      -> Additives: {', '.join(cond.solvent_additives)}")
         
        
-        if cond['flow_rate']:
-            print(f"  Flow rate: {cond['flow_rate']}")
+        if cond.flow_rate:
+            print(f"  Flow rate: {cond.flow_rate}")
         
-        if cond['temperature']:
-            print(f"  Temperature: {cond['temperature']}")
+        if cond.temperature:
+            print(f"  Temperature: {cond.temperature}")
         
         
-        print(f"  Source: \"{cond['line']}\"")
+        print(f"  Source: \"{cond.line}\"")
 
 def create_summary_table(conditions):
     """Create a summary table of all conditions."""
     summary = {
-        'columns': defaultdict(int),
-        'mobile_phases': defaultdict(int),
-        'flow_rates': set(),
-        'temperatures': set()
+        'columns': Counter(
+            f"{cond.column_brand} {cond.column_type}" if cond.column_type else cond.column_brand
+            for cond in conditions if cond.column_brand
+        ),
+        'mobile_phases': Counter(
+            f"{'/'.join(cond.mobile_phase_solvents)} {cond.solvent_ratio}"
+            for cond in conditions if cond.mobile_phase_solvents and cond.solvent_ratio
+        ),
+        'flow_rates': {cond.flow_rate for cond in conditions if cond.flow_rate},
+        'temperatures': {cond.temperature for cond in conditions if cond.temperature}
     }
     
-    for cond in conditions:
-        if cond['column_brand']:
-            col_key = cond['column_brand']
-            if cond['column_type']:
-                col_key += f" {cond['column_type']}"
-            summary['columns'][col_key] += 1
-        
-        if cond['mobile_phase_solvents'] and cond['solvent_ratio']:
-            mp_key = f"{'/'.join(cond['mobile_phase_solvents'])} {cond['solvent_ratio']}"
-            summary['mobile_phases'][mp_key] += 1
-        
-        if cond['flow_rate']:
-            summary['flow_rates'].add(cond['flow_rate'])
-        
-        if cond['temperature']:
-            summary['temperatures'].add(cond['temperature'])
-    
     return summary
 
-def main(pdf_path):
+def save_json(data, path):
+    """Write data to path as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+def main(pdf_path, parser=None, plot=True):
     """
     Main function to extract and analyze polymer chromatography conditions.
+    parser selects the PDF text backend (see extract_text_from_pdf);
+    plot=False skips the frequency plot.
     
     Extracts:
     - Column specifications (brand, type, dimensions, particle size, pore size)
@@ -376,7 +468,7 @@ def main(pdf_path):
     
     
     print("\nExtracting text from PDF...")
-    text = extract_text_from_pdf(pdf_path)
+    text = extract_text_from_pdf(pdf_path, parser=parser)
     print("Text extraction complete.")
     
     
@@ -437,9 +529,10 @@ def main(pdf_path):
     print_detailed_conditions(conditions)
     
     
-    print("\n" + "="*100)
-    print("Generating frequency plot...")
-    plot_polymer_frequency(polymer_dict)
+    if plot:
+        print("\n" + "="*100)
+        print("Generating frequency plot...")
+        plot_polymer_frequency(polymer_dict)
     
     
     json_output = {
@@ -457,26 +550,26 @@ def main(pdf_path):
         entry = {
             "condition_id": i,
             "stationary_phase_details": {
-                "column_brand": cond.get('column_brand'),
-                "column_type": cond.get('column_type'),
-                "material_modification": cond.get('column_type'),
-                "column_dimensions": cond.get('dimensions'),
-                "particle_diameter": cond.get('particle_size'),
-                "pore_size": cond.get('pore_size')
+                "column_brand": cond.column_brand,
+                "column_type": cond.column_type,
+                "material_modification": cond.column_type,
+                "column_dimensions": cond.dimensions,
+                "particle_diameter": cond.particle_size,
+                "pore_size": cond.pore_size
             },
             "solvent_details": {
-                "solvents": cond.get('mobile_phase_solvents', []),
-                "ratio": cond.get('solvent_ratio'),
-                "additives": cond.get('solvent_additives', []),
-                "is_gradient": cond.get('is_gradient', False),
-                "gradient_info": cond.get('gradient_info')
+                "solvents": cond.mobile_phase_solvents,
+                "ratio": cond.solvent_ratio,
+                "additives": cond.solvent_additives,
+                "is_gradient": cond.is_gradient,
+                "gradient_info": cond.gradient_info
             },
             "technical_details": {
-                "flow_rate": cond.get('flow_rate'),
-                "temperature": cond.get('temperature')
+                "flow_rate": cond.flow_rate,
+                "temperature": cond.temperature
             },
             "source_information": {
-                "original_line": cond.get('line')
+                "original_line": cond.line
             }
         }
         json_output["chromatography_data"].append(entry)
@@ -502,8 +595,7 @@ def main(pdf_path):
     
     output_json = pdf_path.replace('.pdf', '_chromatography_data.json')
     try:
-        with open(output_json, 'w') as f:
-            json.dump(json_output, f, indent=2)
+        save_json(json_output, output_json)
         print(f"\nAll data saved to unified JSON: {output_json}")
     except Exception as e:
         print(f"\nWarning: Could not save JSON file: {e}")
@@ -519,7 +611,32 @@ def main(pdf_path):
         'json_data': json_output
     }
 
+def _main_with_report(pdf_path, parser=None):
+    """Run main() without plotting, returning its result and printed report."""
+    report = io.StringIO()
+    with redirect_stdout(report):
+        result = main(pdf_path, parser=parser, plot=False)
+    return result, report.getvalue()
+
+def analyze_pdfs(pdf_paths, parser=None, max_workers=None):
+    """
+    Run main() on several PDFs in parallel in a pool of max_workers
+    processes (CPU count by default). Plots are skipped in the workers.
+    Each worker's report is captured and printed here in input order, so
+    reports never interleave. Results come back in input order.
+    """
+    results = []
+    worker = partial(_main_with_report, parser=parser)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for result, report in executor.map(worker, pdf_paths):
+            print(report, end='')
+            results.append(result)
+    return results
+
 if __name__ == "__main__":
     
-    pdf_path = '/Users/mishakavdia/polymer.project-1/[251] Trathnigg2005.pdf'
-    results = main(pdf_path)
\ No newline at end of file
+    pdf_paths = sys.argv[1:] or ['/Users/mishakavdia/polymer.project-1/[251] Trathnigg2005.pdf']
+    if len(pdf_paths) == 1:
+        results = main(pdf_paths[0])
+    else:
+        results = analyze_pdfs(pdf_paths)
\ No newline at end of file